@@ -1,6 +1,36 @@
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+from models.util import njit, scale_ohlc
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _gbm_core(open_p, high_p, low_p, close_p, Z, drift_dt, vol_sqrt_dt, steps_per_day):
+    """
+    Runs GBM log-Euler steps and reduces them to daily OHLC on the fly,
+    filling the preallocated length-T output arrays in place with log prices
+    relative to S0.
+    """
+    x_t = 0.0
+    for d in range(open_p.shape[0]):
+        open_p[d] = x_t
+        hi = lo = x_t  # reset from the first intra-day step below
+        for k in range(steps_per_day):
+            x_t += drift_dt + vol_sqrt_dt * Z[d * steps_per_day + k]
+            # Running high/low over the intra-day steps (not the open)
+            if k == 0:
+                hi = lo = x_t
+            elif x_t > hi:
+                hi = x_t
+            elif x_t < lo:
+                lo = x_t
+        high_p[d] = hi
+        low_p[d] = lo
+        close_p[d] = x_t
+
+
 def generate_gbm_prices(T, dt, S0, mu, sigma, steps_per_day=4, seed=None):
     """
     Generates a Geometric Brownian Motion price path with OHLC data.
@@ -14,39 +44,21 @@ def generate_gbm_prices(T, dt, S0, mu, sigma, steps_per_day=4, seed=None):
     :param seed: Optional random seed for reproducibility
     :return: days (np.array), open_prices, close_prices, high_prices, low_prices
     """
-    if seed is not None:
-        np.random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     total_steps = T * steps_per_day
     dt_intra = dt / steps_per_day
-    S = np.zeros(total_steps + 1)
-    S[0] = S0
-
-    open_prices = []
-    close_prices = []
-    high_prices = []
-    low_prices = []
-
-    current_day = 0
-    day_prices = []
-
-    for t in range(1, total_steps + 1):
-        Z = np.random.normal()
-        S[t] = S[t-1] * np.exp((mu - 0.5 * sigma**2) * dt_intra + sigma * np.sqrt(dt_intra) * Z)
-        day_prices.append(S[t])
-
-        if t % steps_per_day == 0:
-            open_p = S[t - steps_per_day]
-            close_p = S[t]
-            high_p = np.max(day_prices)
-            low_p = np.min(day_prices)
-
-            open_prices.append(open_p)
-            close_prices.append(close_p)
-            high_prices.append(high_p)
-            low_prices.append(low_p)
+    open_prices = np.empty(T)
+    high_prices = np.empty(T)
+    low_prices = np.empty(T)
+    close_prices = np.empty(T)
 
-            day_prices = []
+    Z = rng.standard_normal(total_steps)
+    _gbm_core(open_prices, high_prices, low_prices, close_prices, Z,
+              (mu - 0.5 * sigma**2) * dt_intra, sigma * math.sqrt(dt_intra), steps_per_day)
+    for prices in (open_prices, high_prices, low_prices, close_prices):
+        np.exp(prices, out=prices)
+    scale_ohlc(open_prices, high_prices, low_prices, close_prices, S0)
 
     days = np.arange(1, T + 1)
-    return days, np.array(open_prices), np.array(close_prices), np.array(high_prices), np.array(low_prices)
\ No newline at end of file
+    return days, open_prices, close_prices, high_prices, low_prices
@@ -1,10 +1,70 @@
+import math
+
 import numpy as np
 
+from models.util import njit, prange, scale_ohlc
+
+
+@njit(cache=True, fastmath=True, nogil=True, parallel=True)
+def _svm_core(open_p, high_p, low_p, close_p, pre_crash_hi, pre_crash_lo, v0, eps1, eps2,
+              rho, sqrt_1mrho2, drift_dt, kappa, theta, sigma_v, dt_intra, steps_per_day, crash_step):
+    """
+    Runs the sequential Heston Euler recurrence and reduces it to daily OHLC
+    on the fly, filling the preallocated (n_paths, T) output arrays in place
+    with log prices relative to S0, without the crash. For the crash, the
+    high/low of the crash day's steps before crash_step are stored in
+    pre_crash_hi/pre_crash_lo. Paths are independent and run in parallel;
+    only t is sequential.
+
+    Constants are folded so each update is a chain of multiply-adds that
+    LLVM can contract into FMAs under fastmath.
+    """
+    sqrt_dt_intra = math.sqrt(dt_intra)
+    half_dt_intra = 0.5 * dt_intra
+    decay = 1.0 - kappa * dt_intra
+    kappa_theta_dt = kappa * theta * dt_intra
+    for p in prange(open_p.shape[0]):
+        # Per-path state stays in locals; only daily OHLC is written out
+        x_t = 0.0
+        v_t = v0
+        for d in range(open_p.shape[1]):
+            open_p[p, d] = x_t
+            hi = lo = x_t  # reset from the first intra-day step below
+            for k in range(steps_per_day):
+                t = d * steps_per_day + k
+                # sqrt(max(v_t, 0) * dt_intra), shared by both diffusion terms
+                vol_dt = math.sqrt(v_t if v_t > 0.0 else 0.0) * sqrt_dt_intra
+
+                # Correlated shocks
+                z1 = eps1[p, t]
+                z2 = rho * z1 + sqrt_1mrho2 * eps2[p, t]
+
+                # Update log price (log Euler) and variance from the same v_t
+                x_t += drift_dt[t] - v_t * half_dt_intra + vol_dt * z1
+                v_next = v_t * decay + kappa_theta_dt + sigma_v * vol_dt * z2
+                v_t = v_next if v_next > 0.0 else 0.0
+
+                # Crash event: applied after exponentiation, record what it needs
+                if t + 1 == crash_step:
+                    pre_crash_hi[p] = hi
+                    pre_crash_lo[p] = lo
+
+                # Running high/low over the intra-day steps (not the open)
+                if k == 0:
+                    hi = lo = x_t
+                elif x_t > hi:
+                    hi = x_t
+                elif x_t < lo:
+                    lo = x_t
+            high_p[p, d] = hi
+            low_p[p, d] = lo
+            close_p[p, d] = x_t
 
 
 def generate_svm_prices(T, dt, S0, v0, kappa, theta, sigma_v, rho, mu,
                         bubble_start=None, bubble_end=None, bubble_mu_extra=None,
-                        crash_day=None, crash_factor=None, steps_per_day=4, seed=None):
+                        crash_day=None, crash_factor=None, steps_per_day=4, seed=None,
+                        n_paths=1, antithetic=False, dtype=np.float64):
     """
     Simplified Stochastic Volatility Model (like Heston),
     with optional bubble/crash logic and OHLC data.
@@ -22,76 +82,80 @@ def generate_svm_prices(T, dt, S0, v0, kappa, theta, sigma_v, rho, mu,
     :param crash_factor: factor by which price is multiplied at crash day
     :param steps_per_day: Number of intra-day steps to simulate
     :param seed: optional random seed
-    :return: days (np.array), open_prices, close_prices, high_prices, low_prices
+    :param n_paths: number of independent paths to simulate in one batch
+    :param antithetic: if True and n_paths > 1, pair each path with one driven by
+                       the negated shocks (antithetic variates), which lowers the
+                       variance of ensemble means for the same number of draws
+    :param dtype: float dtype of the simulated arrays; np.float32 halves memory
+                  and bandwidth for large batches at the cost of precision
+    :return: days (np.array), open_prices, close_prices, high_prices, low_prices;
+             the price arrays have shape (n_paths, T) when n_paths > 1
+    :raises ValueError: if rho is outside [-1, 1]
     """
-    if seed is not None:
-        np.random.seed(seed)
+    if not -1 <= rho <= 1:
+        raise ValueError(f"Correlation must be between -1 and 1, got {rho}.")
 
     total_steps = T * steps_per_day
     dt_intra = dt / steps_per_day
-    days = np.arange(T + 1)
-    S = np.zeros(total_steps + 1)
-    v = np.zeros(total_steps + 1)
-    S[0] = S0
-    v[0] = v0
 
-    open_prices = []
-    close_prices = []
-    high_prices = []
-    low_prices = []
+    # The crash only applies when it falls inside the simulated steps
+    if (crash_day is not None and crash_factor is not None
+            and 0 < crash_day * steps_per_day <= total_steps):
+        crash_step = crash_day * steps_per_day
+    else:
+        crash_step, crash_factor = -1, 1.0
+
+    rng = np.random.default_rng(seed)
 
-    day_prices = []
-    current_offset = 0  # To track the current day
+    open_prices = np.empty((n_paths, T), dtype=dtype)
+    high_prices = np.empty_like(open_prices)
+    low_prices = np.empty_like(open_prices)
+    close_prices = np.empty_like(open_prices)
+    pre_crash_hi = np.zeros(n_paths, dtype=dtype)
+    pre_crash_lo = np.zeros(n_paths, dtype=dtype)
 
     # Generate correlated random draws
-    eps1 = np.random.normal(0, 1, total_steps)
-    eps2 = np.random.normal(0, 1, total_steps)
-    Z1 = eps1
-    Z2 = rho * eps1 + np.sqrt(1 - rho ** 2) * eps2
-
-    for t in range(total_steps):
-        day = t // steps_per_day + 1  # Current day (1-based)
-        if (bubble_start is not None and bubble_end is not None
-                and bubble_mu_extra is not None
-                and bubble_start <= day <= bubble_end):
-            drift_today = mu + bubble_mu_extra
+    if antithetic and n_paths > 1:
+        half = (n_paths + 1) // 2
+        eps = rng.standard_normal((2, half, total_steps), dtype=dtype)
+        eps = np.concatenate([eps, -eps], axis=1)[:, :n_paths]
+    else:
+        eps = rng.standard_normal((2, n_paths, total_steps), dtype=dtype)
+    eps1, eps2 = eps
+
+    # Per-step drift times dt_intra, with the bubble premium added on its (1-based) days
+    drift_dt = np.full(total_steps, mu * dt_intra, dtype=dtype)
+    if bubble_start is not None and bubble_end is not None and bubble_mu_extra is not None:
+        bubble_steps = slice(max(bubble_start - 1, 0) * steps_per_day, max(bubble_end, 0) * steps_per_day)
+        drift_dt[bubble_steps] += bubble_mu_extra * dt_intra
+
+    # The core works in log space relative to S0 (exp is monotonic, so the
+    # daily max/min carry over); prices are recovered with one vectorized exp
+    # afterwards, and S0 and the crash are applied as plain multipliers so
+    # zero or negative values behave as in the linear recurrence
+    _svm_core(open_prices, high_prices, low_prices, close_prices, pre_crash_hi, pre_crash_lo, v0,
+              eps1, eps2, rho, math.sqrt(1 - rho * rho), drift_dt,
+              kappa, theta, sigma_v, dt_intra, steps_per_day, crash_step)
+    for prices in (open_prices, high_prices, low_prices, close_prices, pre_crash_hi, pre_crash_lo):
+        np.exp(prices, out=prices)
+
+    if crash_step > 0:
+        # The crash hits the crash day's last step, i.e. its close
+        crash_idx = crash_day - 1
+        crashed_close = close_prices[:, crash_idx] * crash_factor
+        if steps_per_day > 1:
+            high_prices[:, crash_idx] = np.maximum(pre_crash_hi, crashed_close)
+            low_prices[:, crash_idx] = np.minimum(pre_crash_lo, crashed_close)
         else:
-            drift_today = mu
-
-        # Update variance
-        v[t + 1] = (v[t]
-                    + kappa * (theta - v[t]) * dt_intra
-                    + sigma_v * np.sqrt(max(v[t], 0.0) * dt_intra) * Z2[t])
-
-        if v[t + 1] < 0:
-            v[t + 1] = 0
-
-        # Update price (log Euler)
-        S[t + 1] = S[t] * np.exp((drift_today - 0.5 * v[t]) * dt_intra
-                                 + np.sqrt(max(v[t], 0.0) * dt_intra) * Z1[t])
-
-        # Collect intra-day prices
-        day_prices.append(S[t + 1])
-
-        # Crash event
-        if crash_day is not None and crash_factor is not None:
-            if (t + 1) == crash_day * steps_per_day:
-                S[t + 1] = S[t + 1] * crash_factor
-                day_prices[-1] = S[t + 1]  # Update the last price after crash
-
-        # If end of the day, record OHLC
-        if (t + 1) % steps_per_day == 0:
-            open_p = S[t + 1 - steps_per_day]
-            close_p = S[t + 1]
-            high_p = np.max(day_prices)
-            low_p = np.min(day_prices)
-
-            open_prices.append(open_p)
-            close_prices.append(close_p)
-            high_prices.append(high_p)
-            low_prices.append(low_p)
-
-            day_prices = []
+            high_prices[:, crash_idx] = crashed_close
+            low_prices[:, crash_idx] = crashed_close
+        close_prices[:, crash_idx] = crashed_close
+        after_crash = slice(crash_idx + 1, None)
+        scale_ohlc(open_prices[:, after_crash], high_prices[:, after_crash],
+                   low_prices[:, after_crash], close_prices[:, after_crash], crash_factor)
+    scale_ohlc(open_prices, high_prices, low_prices, close_prices, S0)
 
     days_array = np.arange(1, T + 1)
-    return days_array, np.array(open_prices), np.array(close_prices), np.array(high_prices), np.array(low_prices)
+    if n_paths == 1:
+        return days_array, open_prices[0], close_prices[0], high_prices[0], low_prices[0]
+    return days_array, open_prices, close_prices, high_prices, low_prices
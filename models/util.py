@@ -0,0 +1,26 @@
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain Python loops
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        No-op stand-in for numba.njit, usable both bare and with options.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def scale_ohlc(open_prices, high_prices, low_prices, close_prices, factor):
+    """
+    Multiplies OHLC arrays in place by a constant price factor.
+
+    A negative factor reverses the price order, so high and low are swapped.
+    """
+    for prices in (open_prices, high_prices, low_prices, close_prices):
+        prices *= factor
+    if factor < 0:
+        swapped = high_prices.copy()
+        high_prices[...] = low_prices
+        low_prices[...] = swapped
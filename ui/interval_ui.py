@@ -52,7 +52,7 @@ class ModelInterval:
         self.parent_ui = parent_ui  # Reference to main GUI
         self.interval_number = interval_number
 
-        # Store param widgets in a dict
+        # Param widgets of the currently shown model (see _model_frames)
         self.param_entries = {}
 
         # -------------------------
@@ -104,8 +104,15 @@ class ModelInterval:
         self.config_frame = ttk.LabelFrame(self.frame, text="Model Configuration", padding=(10, 10))
         self.config_frame.grid(row=1, column=0, columnspan=7, pady=(10, 0), sticky="we")
 
-        # Populate parameters for default model
-        self._create_param_widgets(model_name=self.model_var.get())
+        # Build one parameter frame per model up front; switching models
+        # only changes which frame is gridded
+        self._model_frames = {}
+        self._model_param_entries = {}
+        for model_name in self.MODEL_PARAMS:
+            self._create_param_widgets(model_name=model_name)
+
+        self._current_model = self.model_var.get()
+        self._show_model_frame(self._current_model)
 
     # --- Static Methods for Interval Management ---
 
@@ -136,9 +143,13 @@ class ModelInterval:
     def _on_model_change(self, selected_model):
         """
         Called when the user changes the model in the dropdown.
-        Destroys old param widgets and recreates them based on new model.
+        Hides the previous model's param frame and shows the selected one.
         """
-        self._create_param_widgets(model_name=selected_model)
+        if selected_model == self._current_model:
+            return
+        self._model_frames[self._current_model].grid_remove()
+        self._current_model = selected_model
+        self._show_model_frame(selected_model)
 
     # --- Interval UI Actions ---
     def _remove_interval(self):
@@ -164,23 +175,31 @@ class ModelInterval:
     # --- Parameter Management ---
     def _create_param_widgets(self, model_name):
         """
-        Clears old param widgets and re-creates them for the selected model.
+        Builds the (initially hidden) param frame and widgets for a model.
         """
-        # Clear old widgets in config_frame
-        for widget in self.config_frame.winfo_children():
-            widget.destroy()
-        self.param_entries.clear()
+        model_frame = ttk.Frame(self.config_frame)
+        entries = {}
 
         # Retrieve the default parameter dictionary for the chosen model
         defaults = self.MODEL_PARAMS.get(model_name, {})
 
         # Create label/entry for each param
         for idx, (param_key, default_val) in enumerate(defaults.items()):
-            ttk.Label(self.config_frame, text=f"{param_key}:").grid(row=idx, column=0, sticky="w", pady=2)
-            ent = ttk.Entry(self.config_frame, width=20)
+            ttk.Label(model_frame, text=f"{param_key}:").grid(row=idx, column=0, sticky="w", pady=2)
+            ent = ttk.Entry(model_frame, width=20)
             ent.insert(0, default_val)
             ent.grid(row=idx, column=1, sticky="w", padx=5, pady=2)
-            self.param_entries[param_key] = ent
+            entries[param_key] = ent
+
+        self._model_frames[model_name] = model_frame
+        self._model_param_entries[model_name] = entries
+
+    def _show_model_frame(self, model_name):
+        """
+        Grids the param frame of the given model and makes its entries current.
+        """
+        self._model_frames[model_name].grid(row=0, column=0, sticky="we")
+        self.param_entries = self._model_param_entries[model_name]
 
     # --- External API ---
     def get_configuration(self):
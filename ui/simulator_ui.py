@@ -1,4 +1,3 @@
-import csv
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
@@ -71,12 +70,13 @@ class StockSimulatorGUI:
         # 2) Sort intervals by start day
         interval_configs.sort(key=lambda c: int(c["start"]))
 
-        # 3) Initialize lists to collect overall OHLC data
-        overall_days = []
-        overall_open = []
-        overall_close = []
-        overall_high = []
-        overall_low = []
+        # 3) Preallocate overall OHLC arrays; each interval fills its own slice
+        total_T = sum(int(c["end"]) - int(c["start"]) for c in interval_configs)
+        overall_days = np.empty(total_T, dtype=np.int64)
+        overall_open = np.empty(total_T, dtype=np.float64)
+        overall_close = np.empty(total_T, dtype=np.float64)
+        overall_high = np.empty(total_T, dtype=np.float64)
+        overall_low = np.empty(total_T, dtype=np.float64)
 
         last_price = None
         current_offset = 0
@@ -142,27 +142,25 @@ class StockSimulatorGUI:
                 messagebox.showerror("Parameter Error", f"Interval {i}: {e}")
                 return
 
-            # Adjust days to global timeline
-            days = days + current_offset
+            # Write into this interval's slice, adjusting days to global timeline
+            interval_slice = slice(current_offset, current_offset + T)
+            np.add(days, current_offset, out=overall_days[interval_slice])
+            overall_open[interval_slice] = open_p
+            overall_close[interval_slice] = close_p
+            overall_high[interval_slice] = high_p
+            overall_low[interval_slice] = low_p
             current_offset += T
 
-            # Append to overall lists
-            overall_days.extend(days)
-            overall_open.extend(open_p)
-            overall_close.extend(close_p)
-            overall_high.extend(high_p)
-            overall_low.extend(low_p)
-
             # Update last_price for next interval
             last_price = close_p[-1]
 
 
         self.simulation_results = {
-            "Day": np.array(overall_days),
-            "Open": np.array(overall_open),
-            "Close": np.array(overall_close),
-            "High": np.array(overall_high),
-            "Low": np.array(overall_low)
+            "Day": overall_days,
+            "Open": overall_open,
+            "Close": overall_close,
+            "High": overall_high,
+            "Low": overall_low
         }
 
         self._plot_result(overall_days, overall_close)
@@ -204,17 +202,15 @@ class StockSimulatorGUI:
             return  # User cancelled the save dialog
 
         try:
-            with open(file_path, mode='w', newline='') as file:
-                writer = csv.writer(file)
-                writer.writerow(["Day", "Open", "Close", "High", "Low"])  # Header
-
-                for day, open_p, close_p, high_p, low_p in zip(
-                        self.simulation_results["Day"],
-                        self.simulation_results["Open"],
-                        self.simulation_results["Close"],
-                        self.simulation_results["High"],
-                        self.simulation_results["Low"]):
-                    writer.writerow([day, open_p, close_p, high_p, low_p])
+            out = np.column_stack([
+                self.simulation_results["Day"],
+                self.simulation_results["Open"],
+                self.simulation_results["Close"],
+                self.simulation_results["High"],
+                self.simulation_results["Low"]
+            ])
+            np.savetxt(file_path, out, delimiter=",", header="Day,Open,Close,High,Low", comments="",
+                       fmt=["%d", "%.6f", "%.6f", "%.6f", "%.6f"])
 
             messagebox.showinfo("Export Successful", f"Simulation results exported to {file_path}")
         except Exception as e: